@@ -5,8 +5,13 @@ import queue
 import os
 import math
 import json
+import argparse
+import itertools
+import hashlib
+import sqlite3
 from datetime import datetime
 import cv2
+import numpy as np
 from PIL import Image, ImageTk, ImageDraw
 import customtkinter as ctk
 import pygame
@@ -21,6 +26,20 @@ CHEER_SOUND = "cheer.mp3"
 MUSIC_PATH = "lofi.mp3"
 ROLL_SOUND = "roll.mp3"
 
+# Webcam indices (or video files) to watch, one pilot per source
+WEBCAM_SOURCES = [0]
+
+YOLO_MODEL = "yolov8n.pt"
+YOLO_CONF = 0.4
+
+# Distraction logic (also the defaults for --replay sweeps)
+ABSENCE_TOLERANCE = 1.0  # Seconds distracted before the countdown starts
+WARNING_SECONDS = 15    # Countdown before a crash
+
+# Reuse detections across replays of the same recordings (off for live webcams)
+DETECTION_CACHE_ENABLED = False
+DETECTION_CACHE_MAX_MB = 512
+
 # ==========================================
 # 1. MEDIA MANAGER
 # ==========================================
@@ -116,112 +135,372 @@ class LogManager:
 # ==========================================
 # 3. MONITOR (AI VISION - UPDATED)
 # ==========================================
+class DetectionCache:
+    """On-disk LRU store of YOLO detections, keyed by frame content + model config."""
+    SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+    FILE_PATH = os.path.join(SCRIPT_DIR, "detection_cache.db")
+    SCHEMA_VERSION = 2
+
+    def __init__(self, path=None, max_mb=DETECTION_CACHE_MAX_MB):
+        self.config_key = None  # Set by bind() once the model is loaded
+        self.max_bytes = max_mb * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+
+        # Created on the GUI thread, used only by the Monitor thread
+        self.path = path or DetectionCache.FILE_PATH
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        # Freed pages must go back to the OS, otherwise eviction never shrinks the file
+        self.db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=OFF")
+        if self.db.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+            # It's only a cache: older layouts are thrown away, not migrated
+            self.db.execute("DROP TABLE IF EXISTS detections")
+            self.db.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+            self.db.commit()
+            self.db.execute("VACUUM")  # Applies auto_vacuum to files created without it
+        self.db.execute("""CREATE TABLE IF NOT EXISTS detections (
+            key TEXT PRIMARY KEY, boxes TEXT NOT NULL, last_used REAL NOT NULL
+            ) WITHOUT ROWID""")
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON detections (last_used)")
+        self.db.commit()
+
+    def bind(self, weights_path, conf):
+        """Ties every key to the exact weights file and threshold in use,
+        so swapping either never serves stale boxes."""
+        h = hashlib.blake2b(digest_size=16)
+        with open(weights_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        self.config_key = f"{h.hexdigest()}|conf={conf}".encode()
+
+    def key(self, frame):
+        h = hashlib.blake2b(self.config_key, digest_size=16)
+        h.update(str(frame.shape).encode())
+        # Hash an area-averaged thumbnail: ~100x fewer bytes than a 720p frame,
+        # and any change that could move a YOLO box still changes the pixels
+        thumb = cv2.resize(frame, (160, 120), interpolation=cv2.INTER_AREA)
+        h.update(np.ascontiguousarray(thumb).data)
+        return h.hexdigest()
+
+    def get_many(self, keys):
+        """Returns {key: boxes} for every key already in the store."""
+        found = {}
+        for key in keys:
+            row = self.db.execute("SELECT boxes FROM detections WHERE key = ?", (key,)).fetchone()
+            if row: found[key] = [tuple(box) for box in json.loads(row[0])]
+        if found:
+            now = time.time()
+            self.db.executemany("UPDATE detections SET last_used = ? WHERE key = ?", [(now, k) for k in found])
+            self.db.commit()
+        self.hits += sum(1 for key in keys if key in found)
+        self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, entries):
+        now = time.time()
+        rows = [(key, json.dumps(boxes), now) for key, boxes in entries.items()]
+        self.db.executemany("INSERT OR REPLACE INTO detections VALUES (?, ?, ?)", rows)
+        self.db.commit()
+        if self.disk_bytes() > self.max_bytes:
+            self.evict()
+
+    def disk_bytes(self):
+        """Real footprint: every page (rows, keys, indexes, free pages) plus the WAL."""
+        page_count = self.db.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self.db.execute("PRAGMA page_size").fetchone()[0]
+        wal_path = self.path + "-wal"
+        wal_bytes = os.path.getsize(wal_path) if os.path.exists(wal_path) else 0
+        return page_count * page_size + wal_bytes
+
+    def evict(self):
+        # Drop least recently used entries until the files are back under 90% of the limit
+        target = self.max_bytes * 0.9
+        while True:
+            # Fold the WAL back first: a big log alone shouldn't cost us entries
+            self.db.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+            size = self.disk_bytes()
+            count = self.db.execute("SELECT COUNT(*) FROM detections").fetchone()[0]
+            if size <= target or not count: break
+            # Rows are about the same size, so drop the matching share in one go
+            drop = int(count * (1 - target / size)) + 1
+            self.db.execute("""DELETE FROM detections WHERE key IN (
+                SELECT key FROM detections ORDER BY last_used LIMIT ?)""", (drop,))
+            self.db.commit()
+            self.db.execute("PRAGMA incremental_vacuum").fetchall()
+            self.db.commit()
+
+    def close(self):
+        try:
+            self.db.close()
+        except: pass
+
+class PilotState:
+    """Distraction buffer and warning countdown for one capture source."""
+    def __init__(self, label):
+        self.label = label
+
+        # Buffer
+        self.distracted_since = None
+
+        # State
+        self.warning_active = False
+        self.warning_start_time = 0
+
+    def reset(self):
+        self.distracted_since = None
+        self.warning_active = False
+
+    def update(self, distraction_reason, current_time, tolerance, countdown):
+        """Returns seconds left on the warning, or None if this seat is safe."""
+        if not distraction_reason:
+            self.reset()
+            return None
+
+        # Tolerance is measured on the seat's own clock, so live and replay agree
+        if self.distracted_since is None:
+            self.distracted_since = current_time
+        if current_time - self.distracted_since < tolerance:
+            return None
+
+        if not self.warning_active:
+            # START WARNING
+            self.warning_active = True
+            self.warning_start_time = current_time
+
+        # CONTINUE WARNING
+        elapsed = current_time - self.warning_start_time
+        return countdown - int(elapsed)
+
+
 class Monitor(threading.Thread):
-    def __init__(self, status_queue, pip_queue, webcam_index=0):
+    def __init__(self, status_queue, pip_queue, webcam_index=0, sources=None, cache=None, replay=False,
+                 conf=YOLO_CONF, absence_tolerance=ABSENCE_TOLERANCE, warning_seconds=WARNING_SECONDS):
         super().__init__(daemon=True)
         self.status_queue = status_queue
         self.pip_queue = pip_queue
-        self.webcam_index = webcam_index
+        # One pilot per capture source (webcam index or video file)
+        self.sources = list(sources) if sources else [webcam_index]
+        self.cache = cache
+        # Replay: sources are recordings, timed by frame position and run flat out
+        self.replay = replay
+        self.conf = conf
         self.running = True
-        self.crashed = False
+        self.clock = 0.0
+        self.RECONNECT_TICKS = 20  # Empty reads before reopening a camera
+        # Replay only: per-tick (reasons, times) for the whole recording
+        self.timeline = []
         
-        # Buffer
-        self.absence_frames = 0      
-        self.ABSENCE_TOLERANCE = 10  # Slightly faster reaction
-        
-        # State
-        self.warning_active = False
-        self.warning_start_time = 0
-        self.last_warning_int = 0
+        self.reset(absence_tolerance, warning_seconds)
         
         print("⏳ Loading AI Model...")
-        self.model = YOLO("yolov8n.pt") 
+        self.model = YOLO(YOLO_MODEL) 
         print("✅ AI Ready.")
 
+        if self.cache:
+            # ckpt_path is where ultralytics actually found/downloaded the weights
+            self.cache.bind(self.model.ckpt_path or YOLO_MODEL, self.conf)
+
+    def reset(self, absence_tolerance, warning_seconds):
+        self.ABSENCE_TOLERANCE = absence_tolerance
+        self.WARNING_SECONDS = warning_seconds
+        
+        # State
+        multi = len(self.sources) > 1
+        self.pilots = [PilotState(f"SEAT {i+1}" if multi else None) for i in range(len(self.sources))]
+        self.warning_active = False
+        self.last_warning = None
+        self.crashed = False
+        self.crash_reason = None
+
     def run(self):
-        cap = cv2.VideoCapture(self.webcam_index)
+        caps = [cv2.VideoCapture(src) for src in self.sources]
+        failed = ", ".join(repr(src) for src, cap in zip(self.sources, caps) if not cap.isOpened())
+        if failed:
+            # A seat we can't see at all is a setup problem, not a distracted pilot
+            if self.replay:
+                print(f"❌ Could not open recording {failed}")
+            else:
+                self.status_queue.put(("CAMERA_ERROR", f"Could not open camera {failed}"))
+            self.running = False
+        fps = [cap.get(cv2.CAP_PROP_FPS) or 30 for cap in caps]
+        missed = [0] * len(caps)
         
         while self.running:
-            ret, frame = cap.read()
-            if not ret:
-                time.sleep(0.1)
+            # Grab every camera first so the batch is as close to in-sync as possible
+            grabbed = [cap.grab() for cap in caps]
+            frames = {}
+            clocks = {}
+            for i, cap in enumerate(caps):
+                if not grabbed[i]: continue
+                ret, frame = cap.retrieve()
+                if ret:
+                    frames[i] = frame
+                    clocks[i] = cap.get(cv2.CAP_PROP_POS_FRAMES) / fps[i]
+
+            if not self.replay:
+                for i, src in enumerate(self.sources):
+                    if i in frames:
+                        if missed[i] >= self.RECONNECT_TICKS: print(f"📷 Camera {src!r} is back")
+                        missed[i] = 0
+                        continue
+                    missed[i] += 1
+                    if missed[i] % self.RECONNECT_TICKS == 0:
+                        # Camera dropped out (unplugged, USB reset...) -> try to reopen it
+                        print(f"⚠️ No frames from camera {src!r}, reconnecting...")
+                        caps[i].release()
+                        caps[i] = cv2.VideoCapture(src)
+
+            if self.replay and len(frames) < len(caps): break  # A recording ran out
+
+            # One batched YOLO call for all cameras this tick
+            indices = list(frames.keys())
+            detections = dict(zip(indices, self.detect([frames[i] for i in indices]))) if frames else {}
+
+            # Determine if there is ANY distraction, per seat
+            reasons = {i: self.check_frame(frames[i], detections[i]) for i in frames}
+
+            if self.replay:
+                # Only record: score() judges the timeline, as often as a sweep needs
+                self.timeline.append((reasons, clocks))
                 continue
 
-            results = self.model(frame, verbose=False, conf=0.4)
-            found_person = False
-            found_phone = False
-
-            for result in results:
-                for box in result.boxes:
-                    x1, y1, x2, y2 = map(int, box.xyxy[0])
-                    cls_id = int(box.cls[0])
-                    cls_name = self.model.names[cls_id]
-                    
-                    if cls_name == "person":
-                        found_person = True
-                        cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-                        cv2.putText(frame, "PILOT", (x1, y1-10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-                        
-                    elif cls_name in ["cell phone", "mobile phone"]:
-                        found_phone = True
-                        cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 0, 255), 3)
-                        cv2.putText(frame, "PHONE", (x1, y1-10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 2)
+            current_time = time.time()
+            self.clock = current_time
+            self.judge(reasons, {i: current_time for i in frames})
 
             try:
-                small_frame = cv2.resize(frame, (240, 180))
-                if self.pip_queue.empty(): 
-                    self.pip_queue.put(small_frame)
+                if frames:
+                    small_frame = self.build_pip([frames.get(i) for i in range(len(caps))])
+                    if self.pip_queue.empty(): 
+                        self.pip_queue.put(small_frame)
             except: pass
 
-            current_time = time.time()
-            
-            # --- UPDATED LOGIC: UNIFIED DISTRACTION HANDLING ---
-            
-            # Determine if there is ANY distraction
-            distraction_reason = None
-            if found_phone:
-                distraction_reason = "PHONE DETECTED"
-            elif not found_person:
-                distraction_reason = "PILOT ABSENCE"
-            
-            # If Distracted (Phone OR No Person)
-            if distraction_reason and not self.crashed:
-                self.absence_frames += 1
-                
-                # Buffer Check
-                if self.absence_frames > self.ABSENCE_TOLERANCE:
-                    if not self.warning_active:
-                        # START WARNING
-                        self.warning_active = True
-                        self.warning_start_time = current_time
-                    else:
-                        # CONTINUE WARNING
-                        elapsed = current_time - self.warning_start_time
-                        remaining = 15 - int(elapsed)
-                        
-                        if remaining <= 0:
-                            # Time's up -> Crash
-                            self.trigger_crash(distraction_reason)
-                        else:
-                            # Update UI (only if second changed)
-                            if remaining != self.last_warning_int:
-                                self.last_warning_int = remaining
-                                # Send Tuple: (Time, Reason)
-                                self.status_queue.put(("WARNING", (remaining, distraction_reason)))
-            
-            # Else Safe (Person AND No Phone)
-            else:
-                self.absence_frames = 0 
-                if self.warning_active and not self.crashed:
-                    # Clear Warning
-                    self.warning_active = False
-                    self.status_queue.put(("CLEAR_WARNING", None))
+            time.sleep(0.05 if frames else 0.1) 
+        for cap in caps: cap.release()
+        if self.cache:
+            print(f"🗄️ Detection cache: {self.cache.hits} hits, {self.cache.misses} misses")
+            self.cache.close()
+
+    def judge(self, reasons, times):
+        """Runs one tick of per-seat distractions through the pilots and tells the GUI."""
+        # --- UPDATED LOGIC: UNIFIED DISTRACTION HANDLING ---
+        if self.crashed: return
+        warnings = []
+
+        for i, pilot in enumerate(self.pilots):
+            if i not in reasons:
+                # No picture this tick: drop the seat's countdown instead of freezing
+                # it, so a stale start time can't crash it the moment the camera returns
+                pilot.reset()
+                continue
 
-            time.sleep(0.05) 
-        cap.release()
+            distraction_reason = reasons[i]
+            remaining = pilot.update(distraction_reason, times[i], self.ABSENCE_TOLERANCE, self.WARNING_SECONDS)
+            if remaining is None: continue
+
+            if pilot.label:
+                distraction_reason = f"{pilot.label} {distraction_reason}"
+            warnings.append((remaining, distraction_reason))
+
+        if warnings:
+            # Every seat counting down gets its own line, most urgent first
+            warnings.sort()
+            self.warning_active = True
+            remaining, distraction_reason = warnings[0]
+            if remaining <= 0:
+                # Time's up -> Crash. The room shares one flight, so the
+                # first seat to run out crashes (and logs) it for everyone.
+                self.trigger_crash(distraction_reason)
+            elif warnings != self.last_warning:
+                # Update UI (only if a second or reason changed)
+                self.last_warning = warnings
+                # Send List of Tuples: [(Time, Reason), ...]
+                self.status_queue.put(("WARNING", warnings))
+        
+        # Else Safe (every seat has its pilot and no phone)
+        elif self.warning_active:
+            # Clear Warning
+            self.warning_active = False
+            self.last_warning = None
+            self.status_queue.put(("CLEAR_WARNING", None))
+
+    def score(self, absence_tolerance, warning_seconds):
+        """Judges the recorded replay timeline again with other settings.
+        No decoding or YOLO, so every sweep point after the first is nearly free."""
+        self.reset(absence_tolerance, warning_seconds)
+        for reasons, times in self.timeline:
+            self.clock = max(times.values())
+            self.judge(reasons, times)
+            if self.crashed: break
+
+    def check_frame(self, frame, boxes):
+        """Draws the detections on the frame and returns the distraction, if any."""
+        found_person = False
+        found_phone = False
+
+        for x1, y1, x2, y2, cls_name in boxes:
+            if cls_name == "person":
+                found_person = True
+                cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
+                cv2.putText(frame, "PILOT", (x1, y1-10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+                
+            elif cls_name in ["cell phone", "mobile phone"]:
+                found_phone = True
+                cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 0, 255), 3)
+                cv2.putText(frame, "PHONE", (x1, y1-10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 2)
+
+        if found_phone:
+            return "PHONE DETECTED"
+        if not found_person:
+            return "PILOT ABSENCE"
+        return None
+
+    def detect(self, frames):
+        """Runs YOLO once over the batch of frames the cache hasn't seen.
+        Returns one list of (x1, y1, x2, y2, class_name) per frame."""
+        detections = [None] * len(frames)
+        if self.cache:
+            keys = [self.cache.key(frame) for frame in frames]
+            hits = self.cache.get_many(keys)
+            detections = [hits.get(key) for key in keys]
+
+        misses = [n for n, boxes in enumerate(detections) if boxes is None]
+        if not misses:
+            return detections
+
+        results = self.model([frames[n] for n in misses], verbose=False, conf=self.conf)
+        for n, result in zip(misses, results):
+            boxes = []
+            for box in result.boxes:
+                x1, y1, x2, y2 = map(int, box.xyxy[0])
+                cls_id = int(box.cls[0])
+                boxes.append((x1, y1, x2, y2, self.model.names[cls_id]))
+            detections[n] = boxes
+
+        if self.cache:
+            self.cache.put_many({keys[n]: detections[n] for n in misses})
+        return detections
+
+    def build_pip(self, frames, size=(240, 180)):
+        """Tiles every camera into one picture-in-picture frame."""
+        if len(frames) == 1:
+            return cv2.resize(frames[0], size)
+
+        cols = math.ceil(math.sqrt(len(frames)))
+        rows = math.ceil(len(frames) / cols)
+        tile_w, tile_h = size[0] // cols, size[1] // rows
+        pip = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+        for n, frame in enumerate(frames):
+            if frame is None: continue  # Camera dropped this tick
+            r, c = divmod(n, cols)
+            pip[r*tile_h:(r+1)*tile_h, c*tile_w:(c+1)*tile_w] = cv2.resize(frame, (tile_w, tile_h))
+        return pip
 
     def trigger_crash(self, reason):
         self.crashed = True
+        self.crash_reason = reason
         self.warning_active = False
         self.status_queue.put(("CRASH", reason))
 
@@ -325,6 +604,7 @@ class FocusApp(ctk.CTk):
                 if msg == "CRASH": self.show_crash(data)
                 elif msg == "WARNING": self.show_warning(data)
                 elif msg == "CLEAR_WARNING": self.hide_warning()
+                elif msg == "CAMERA_ERROR": self.show_camera_error(data)
         except queue.Empty: pass
 
         self.after(33, self._render_loop)
@@ -580,7 +860,8 @@ class FocusApp(ctk.CTk):
         if self.monitor: self.monitor.stop()
         if self.player: self.player.stop()
         
-        self.monitor = Monitor(self.status_queue, self.pip_queue)
+        cache = DetectionCache() if DETECTION_CACHE_ENABLED else None
+        self.monitor = Monitor(self.status_queue, self.pip_queue, sources=WEBCAM_SOURCES, cache=cache)
         self.player = VideoPlayer(self.bg_video_queue, VIDEO_PATH)
         
         self.monitor.start()
@@ -607,9 +888,13 @@ class FocusApp(ctk.CTk):
             self.success()
 
     def show_warning(self, data):
-        # Data is (seconds, reason)
-        seconds_left, reason = data
-        self.warn_txt.configure(text=f"ALARM: {reason}!\n{seconds_left}s")
+        # Data is [(seconds, reason), ...], one per seat counting down
+        if len(data) == 1:
+            seconds_left, reason = data[0]
+            text = f"ALARM: {reason}!\n{seconds_left}s"
+        else:
+            text = "ALARM!\n" + "\n".join(f"{reason}: {seconds_left}s" for seconds_left, reason in data)
+        self.warn_txt.configure(text=text)
         MediaManager.start_alarm()
         if not self.is_warning_visible:
             self.warn_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
@@ -648,6 +933,28 @@ class FocusApp(ctk.CTk):
                       fg_color="#555", height=50, width=200, 
                       command=lambda: [top.destroy(), self.return_to_home()]).pack(pady=30)
 
+    def show_camera_error(self, message):
+        # Flight never really took off, so nothing goes in the logbook
+        self.hide_warning()
+        self.video_running = False
+        if self.monitor: self.monitor.stop()
+        if self.player: self.player.stop()
+        
+        MediaManager.stop_music()
+        self.attributes("-fullscreen", False)
+        
+        top = ctk.CTkToplevel(self)
+        top.geometry("400x300")
+        top.title("CAMERA ERROR")
+        top.attributes("-topmost", True)
+        
+        ctk.CTkLabel(top, text="NO CAMERA!", font=("Impact", 30), text_color="#FF8C00").pack(pady=(40, 20))
+        ctk.CTkLabel(top, text=message, font=("Arial", 16), wraplength=360).pack(pady=10)
+        
+        ctk.CTkButton(top, text="RETURN TO HOME 🏠", font=("Arial", 14, "bold"), 
+                      fg_color="#555", height=50, width=200, 
+                      command=lambda: [top.destroy(), self.return_to_home()]).pack(pady=30)
+
     def success(self):
         self.video_running = False
         if self.monitor: self.monitor.stop()
@@ -679,6 +986,58 @@ class FocusApp(ctk.CTk):
         try: os._exit(0)
         except: pass
 
+# ==========================================
+# 6. REPLAY (HEADLESS)
+# ==========================================
+def run_replay(sources, conf, settings, use_cache=True):
+    """Decodes and detects the recorded clips once, then judges them
+    with every (tolerance, countdown) pair in settings."""
+    cache = DetectionCache() if use_cache else None
+    monitor = Monitor(queue.Queue(), None, sources=sources, cache=cache, replay=True, conf=conf)
+    start = time.time()
+    monitor.run()  # No GUI to keep responsive, so stay on this thread
+    print(f"🎞️ conf={conf}: {len(monitor.timeline)} frames decoded in {time.time() - start:.1f}s")
+    if not monitor.timeline:
+        print("NO FOOTAGE")
+        return
+
+    for tolerance, countdown in settings:
+        start = time.time()
+        monitor.status_queue = queue.Queue()
+        monitor.score(tolerance, countdown)
+
+        warnings = 0
+        warning = False
+        while not monitor.status_queue.empty():
+            msg, data = monitor.status_queue.get_nowait()
+            if msg == "WARNING" and not warning: warnings += 1
+            warning = msg == "WARNING"
+
+        if monitor.crashed:
+            result = f"CRASHED at {monitor.clock:.1f}s ({monitor.crash_reason})"
+        else:
+            result = f"LANDED after {monitor.clock:.1f}s"
+        print(f"tolerance={tolerance}s countdown={countdown}s conf={conf}: {result}, "
+              f"{warnings} warnings, {time.time() - start:.2f}s to judge")
+
 if __name__ == "__main__":
-    app = FocusApp()
-    app.mainloop()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Flight Focus ✈️")
+    parser.add_argument("--replay", nargs="+", metavar="VIDEO",
+                        help="replay recorded clips (one per seat) without the GUI")
+    parser.add_argument("--tolerance", nargs="+", type=float, default=[ABSENCE_TOLERANCE],
+                        help="seconds distracted before the countdown; several values sweep")
+    parser.add_argument("--countdown", nargs="+", type=int, default=[WARNING_SECONDS],
+                        help="countdown seconds before a crash; several values sweep")
+    parser.add_argument("--conf", nargs="+", type=float, default=[YOLO_CONF],
+                        help="YOLO confidence threshold; several values sweep")
+    parser.add_argument("--no-cache", action="store_true", help="don't reuse stored detections")
+    args = parser.parse_args()
+
+    if args.replay:
+        # Detections only depend on conf; tolerance/countdown just re-judge them
+        settings = list(itertools.product(args.tolerance, args.countdown))
+        for conf in args.conf:
+            run_replay(args.replay, conf, settings, use_cache=not args.no_cache)
+    else:
+        app = FocusApp()
+        app.mainloop()
\ No newline at end of file